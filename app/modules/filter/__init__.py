@@ -1,5 +1,11 @@
 import re
-from typing import List, Tuple, Union, Dict, Optional
+from typing import Callable, List, Tuple, Union, Dict, Optional
+
+try:
+    # 可选的google-re2引擎，线性时间DFA匹配，无回溯爆炸风险
+    import re2 as re_engine
+except ImportError:
+    re_engine = re
 
 from app.core.context import TorrentInfo, MediaInfo
 from app.core.metainfo import MetaInfo
@@ -13,6 +19,14 @@ class FilterModule(_ModuleBase):
     parser: RuleParser = None
     # 媒体信息
     media: MediaInfo = None
+    # 规则组编译缓存
+    _compiled_rule_cache: Dict[str, Callable[[Callable[[str], bool]], bool]] = None
+    # 规则字符串 -> 多级规则组编译结果
+    _rule_groups_cache: Dict[str, tuple] = None
+    # 全规则包含项联合正则
+    _union_pattern: re.Pattern = None
+    # 联合正则分组名 -> 规则名
+    _union_group_names: Dict[str, str] = None
 
     # 内置规则集
     rule_set: Dict[str, dict] = {
@@ -128,6 +142,83 @@ class FilterModule(_ModuleBase):
 
     def init_module(self) -> None:
         self.parser = RuleParser()
+        self._compiled_rule_cache = {}
+        self._rule_groups_cache = {}
+        # 预编译规则集正则
+        for rule in self.rule_set.values():
+            rule["include"] = [self.__compile_pattern(pattern) if isinstance(pattern, str)
+                               else pattern
+                               for pattern in rule.get("include") or []]
+            # 排除项为或的关系，合并为单个正则，一次扫描即可
+            excludes = rule.get("exclude") or []
+            rule["exclude_union"] = self.__compile_pattern(
+                "|".join(f"(?:{pattern})" for pattern in excludes)) if excludes else None
+            # 为每个正则构建匹配函数，纯文字模式走子串查找快速路径
+            rule["include_matchers"] = [self.__build_matcher(pattern)
+                                        for pattern in rule["include"]]
+            rule["exclude_matcher"] = self.__build_matcher(rule["exclude_union"]) \
+                if rule["exclude_union"] is not None else None
+        # 构建全规则包含项联合正则，对内容一次扫描即可批量得到命中的规则集合
+        # 仅纳入单包含项规则（命中联合正则即可证明包含项成立）
+        self._union_group_names = {}
+        union_parts = []
+        union_flags = 0
+        for index, (name, rule) in enumerate(self.rule_set.items()):
+            includes = rule.get("include") or []
+            if len(includes) != 1:
+                continue
+            # 规则名可能不是合法分组名（如4K），使用序号分组映射
+            group = f"r{index}"
+            self._union_group_names[group] = name
+            union_parts.append(f"(?P<{group}>{includes[0].pattern})")
+            if self.__needs_ignorecase(includes[0].pattern):
+                union_flags |= re.IGNORECASE
+        self._union_pattern = self.__engine_compile("|".join(union_parts),
+                                                    union_flags) if union_parts else None
+
+    @staticmethod
+    def __needs_ignorecase(pattern: str) -> bool:
+        """
+        含大写转义类（如\\S、\\W）的正则小写化会破坏语义，需保留IGNORECASE原样编译
+        """
+        return re.search(r"\\[A-Z]", pattern) is not None
+
+    @staticmethod
+    def __engine_compile(pattern: str, flags: int = 0):
+        """
+        优先使用re2引擎编译，语法不受支持时回退到内置re
+        """
+        if re_engine is not re:
+            try:
+                return re_engine.compile(pattern, flags)
+            except Exception:
+                pass
+        return re.compile(pattern, flags)
+
+    @staticmethod
+    def __build_matcher(compiled) -> Callable[[str], bool]:
+        """
+        为编译后的正则构建匹配函数：纯文字模式（或纯文字的或关系）直接用子串查找，
+        在短内容上比正则引擎快一个量级；其余模式仍走正则搜索
+        """
+        pattern = compiled.pattern
+        parts = pattern.split("|")
+        if all(part and not set(part) & set(r".^$*+?{}[]()\\") for part in parts):
+            if len(parts) == 1:
+                return lambda content, _literal=parts[0]: _literal in content
+            return lambda content, _literals=tuple(parts): \
+                any(literal in content for literal in _literals)
+        return compiled.search
+
+    @staticmethod
+    def __compile_pattern(pattern: str):
+        """
+        编译规则正则：匹配内容已统一转为小写，正则同步转为小写后可省去IGNORECASE的
+        逐字符折叠开销
+        """
+        if FilterModule.__needs_ignorecase(pattern):
+            return FilterModule.__engine_compile(pattern, re.IGNORECASE)
+        return FilterModule.__engine_compile(pattern.lower())
 
     def stop(self):
         pass
@@ -150,19 +241,16 @@ class FilterModule(_ModuleBase):
         if not rule_string:
             return torrent_list
         self.media = mediainfo
-        # 返回种子列表
-        ret_torrents = []
-        for torrent in torrent_list:
-            # 能命中优先级的才返回
-            if not self.__get_order(torrent, rule_string):
-                continue
-            # 季集数过滤
-            if season_episodes \
-                    and not self.__match_season_episodes(torrent, season_episodes):
-                continue
-            ret_torrents.append(torrent)
-
-        return ret_torrents
+        # 多级规则只解析/编译一次
+        group_predicates = self.__get_group_predicates(rule_string)
+        # 方法提升为局部变量，循环内省去属性查找
+        get_order = self.__get_order
+        match_season_episodes = self.__match_season_episodes
+        # 能命中优先级且通过季集数过滤的才返回
+        return [torrent for torrent in torrent_list
+                if get_order(torrent, group_predicates)
+                and (not season_episodes
+                     or match_season_episodes(torrent, season_episodes))]
 
     @staticmethod
     def __match_season_episodes(torrent: TorrentInfo, season_episodes: Dict[int, list]):
@@ -196,21 +284,76 @@ class FilterModule(_ModuleBase):
                 return False
         return True
 
-    def __get_order(self, torrent: TorrentInfo, rule_str: str) -> Optional[TorrentInfo]:
+    def __get_group_predicates(self, rule_str: str) -> tuple:
+        """
+        获取规则字符串对应的多级规则组编译结果
+        """
+        predicates = self._rule_groups_cache.get(rule_str)
+        if predicates is None:
+            predicates = tuple(self.__get_group_predicate(rule_group)
+                               for rule_group in rule_str.split('>'))
+            self._rule_groups_cache[rule_str] = predicates
+        return predicates
+
+    def __get_group_predicate(self, rule_group: str) -> Callable[[Callable[[str], bool]], bool]:
+        """
+        获取单个规则组的编译结果（规则字符串固定，编译结果可复用）
+        """
+        predicate = self._compiled_rule_cache.get(rule_group)
+        if predicate is None:
+            parsed_group = self.parser.parse(rule_group.strip()).as_list()[0]
+            reordered_group = self.__reorder_group(parsed_group)
+            try:
+                predicate = self.__compile_group(reordered_group)
+            except Exception as e:
+                # 编译失败时回退到解释执行，用户的过滤规则不应导致崩溃
+                logger.error(f"编译规则组 {rule_group} 失败：{str(e)}，回退到解释执行")
+                predicate = lambda match, _group=reordered_group: \
+                    self.__eval_group(_group, match)
+            self._compiled_rule_cache[rule_group] = predicate
+        return predicate
+
+    def __get_order(self, torrent: TorrentInfo, group_predicates: tuple) -> Optional[TorrentInfo]:
         """
         获取种子匹配的规则优先级，值越大越优先，未匹配时返回None
+        :param group_predicates: 多级规则组编译结果
         """
-        # 多级规则
-        rule_groups = rule_str.split('>')
         # 优先级
         res_order = 100
         # 是否匹配
         matched = False
 
-        for rule_group in rule_groups:
-            # 解析规则组
-            parsed_group = self.parser.parse(rule_group.strip())
-            if self.__match_group(torrent, parsed_group.as_list()[0]):
+        # 标题较短且多数规则可在标题上命中，先扫描标题；
+        # 标题+副标题+标签的完整内容按需延迟构建（统一小写与免折叠正则配合）
+        title = f"{torrent.title}".lower()
+        _full_content: list = []
+
+        def get_content() -> str:
+            if not _full_content:
+                _full_content.append(f"{torrent.title} {torrent.description} "
+                                     f"{' '.join(torrent.labels or [])}".lower())
+            return _full_content[0]
+
+        # 联合正则一次扫描标题得到包含项已命中的规则集合
+        # （标题是完整内容的子串，命中即成立；未命中的规则仍需检查完整内容）
+        if self._union_pattern:
+            include_hits = {self._union_group_names[match.lastgroup]
+                            for match in self._union_pattern.finditer(title)}
+        else:
+            include_hits = set()
+
+        # 规则项匹配结果缓存，同一种子在多个分支/多级规则中复用
+        rule_results: Dict[str, bool] = {}
+
+        def match_rule(rule_name: str) -> bool:
+            result = rule_results.get(rule_name)
+            if result is None:
+                result = self.__match_rule(torrent, rule_name, get_content, include_hits)
+                rule_results[rule_name] = result
+            return result
+
+        for predicate in group_predicates:
+            if predicate(match_rule):
                 # 出现匹配时中断
                 matched = True
                 logger.info(f"种子 {torrent.site_name} - {torrent.title} 优先级为 {100 - res_order + 1}")
@@ -221,29 +364,112 @@ class FilterModule(_ModuleBase):
 
         return None if not matched else torrent
 
-    def __match_group(self, torrent: TorrentInfo, rule_group: Union[list, str]) -> bool:
+    def __compile_group(self, rule_group: Union[list, str]) -> Callable[[Callable[[str], bool]], bool]:
+        """
+        将解析后的规则组编译为原生布尔表达式函数，match参数为规则项匹配函数
+        """
+        expression = self.__render_group(rule_group)
+        return eval(f"lambda match: {expression}")
+
+    def __reorder_group(self, rule_group: Union[list, str]) -> Union[list, str]:
+        """
+        将同级and/or操作数按预估匹配代价升序重排，便宜的规则先求值以提高短路收益。
+        规则项无副作用，重排不改变布尔结果
+        """
+        if not isinstance(rule_group, list):
+            return rule_group
+        # RuleParser在!(...)等形式下会泄漏字面括号token，先剔除以免被当作操作数
+        rule_group = [item for item in rule_group if item not in ("(", ")")]
+        if not rule_group:
+            return rule_group
+        if len(rule_group) == 1:
+            return [self.__reorder_group(rule_group[0])]
+        if rule_group[0] == "not":
+            return ["not"] + [self.__reorder_group(item) for item in rule_group[1:]]
+        operators = [rule_group[index] for index in range(1, len(rule_group) - 1, 2)]
+        operands = [self.__reorder_group(rule_group[index]) for index in range(0, len(rule_group), 2)]
+        if len(set(operators)) == 1:
+            # 同级操作符一致时才可安全重排（infixNotation按优先级分层，正常均满足）
+            operands.sort(key=self.__group_cost)
+        reordered = [operands[0]]
+        for operator, operand in zip(operators, operands[1:]):
+            reordered += [operator, operand]
+        return reordered
+
+    def __group_cost(self, rule_group: Union[list, str]) -> int:
         """
-        判断种子是否匹配规则组
+        预估规则（组）的匹配代价，以正则长度为近似
+        """
+        if isinstance(rule_group, list):
+            return sum(self.__group_cost(item) for item in rule_group
+                       if item not in ("and", "or", "not"))
+        rule = self.rule_set.get(rule_group)
+        if not rule:
+            # 未知规则直接返回False，代价最低
+            return 0
+        cost = sum(len(pattern.pattern) for pattern in rule.get("include") or [])
+        exclude_union = rule.get("exclude_union")
+        if exclude_union is not None:
+            cost += len(exclude_union.pattern)
+        return cost
+
+    def __render_group(self, rule_group: Union[list, str]) -> str:
+        """
+        将解析后的规则组渲染为Python布尔表达式
         """
         if not isinstance(rule_group, list):
             # 不是列表，说明是规则名称
-            return self.__match_rule(torrent, rule_group)
-        elif isinstance(rule_group, list) and len(rule_group) == 1:
+            return f"match({rule_group!r})"
+        if not rule_group:
+            # 空组（如括号内容被剔除后）不命中
+            return "False"
+        if len(rule_group) == 1:
             # 只有一个规则项
-            return self.__match_group(torrent, rule_group[0])
-        elif rule_group[0] == "not":
+            return self.__render_group(rule_group[0])
+        if rule_group[0] == "not":
             # 非操作
-            return not self.__match_group(torrent, rule_group[1:])
-        elif rule_group[1] == "and":
-            # 与操作
-            return self.__match_group(torrent, rule_group[0]) and self.__match_group(torrent, rule_group[2:])
-        elif rule_group[1] == "or":
-            # 或操作
-            return self.__match_group(torrent, rule_group[0]) or self.__match_group(torrent, rule_group[2:])
+            return "(not %s)" % self.__render_group(
+                rule_group[1] if len(rule_group) == 2 else rule_group[1:])
+        # 与/或链，and/or由解释器原生短路求值
+        parts = [self.__render_group(rule_group[0])]
+        for index in range(1, len(rule_group) - 1, 2):
+            operator = rule_group[index]
+            if operator not in ("and", "or"):
+                # 意外token不能渲染进代码，抛出后由调用方回退到解释执行
+                raise ValueError(f"无法识别的操作符：{operator}")
+            parts.append(operator)
+            parts.append(self.__render_group(rule_group[index + 1]))
+        return "(%s)" % " ".join(parts)
 
-    def __match_rule(self, torrent: TorrentInfo, rule_name: str) -> bool:
+    def __eval_group(self, rule_group: Union[list, str],
+                     match: Callable[[str], bool]) -> bool:
+        """
+        规则组的解释执行路径，编译失败时保底，求值顺序与编译结果一致
+        """
+        if not isinstance(rule_group, list):
+            return match(rule_group)
+        if not rule_group:
+            return False
+        if len(rule_group) == 1:
+            return self.__eval_group(rule_group[0], match)
+        if rule_group[0] == "not":
+            return not self.__eval_group(
+                rule_group[1] if len(rule_group) == 2 else rule_group[1:], match)
+        result = self.__eval_group(rule_group[0], match)
+        for index in range(1, len(rule_group) - 1, 2):
+            operator = rule_group[index]
+            if operator == "and":
+                result = result and self.__eval_group(rule_group[index + 1], match)
+            elif operator == "or":
+                result = result or self.__eval_group(rule_group[index + 1], match)
+        return result
+
+    def __match_rule(self, torrent: TorrentInfo, rule_name: str,
+                     get_content: Callable[[], str], include_hits: set) -> bool:
         """
         判断种子是否匹配规则项
+        :param get_content: 延迟构建完整匹配内容的函数
+        :param include_hits: 标题联合扫描已证实包含项命中的规则名集合
         """
         if not self.rule_set.get(rule_name):
             # 规则不存在
@@ -253,22 +479,20 @@ class FilterModule(_ModuleBase):
         # 符合TMDB规则的直接返回True，即不过滤
         if tmdb and self.__match_tmdb(tmdb):
             return True
-        # 包含规则项
-        includes = self.rule_set[rule_name].get("include") or []
-        # 排除规则项
-        excludes = self.rule_set[rule_name].get("exclude") or []
+        # 包含规则项匹配函数
+        include_matchers = self.rule_set[rule_name].get("include_matchers") or []
+        # 排除规则项匹配函数（合并后的正则）
+        exclude_matcher = self.rule_set[rule_name].get("exclude_matcher")
         # FREE规则
         downloadvolumefactor = self.rule_set[rule_name].get("downloadvolumefactor")
-        # 匹配项
-        content = f"{torrent.title} {torrent.description} {' '.join(torrent.labels or [])}"
-        for include in includes:
-            if not re.search(r"%s" % include, content, re.IGNORECASE):
-                # 未发现包含项
-                return False
-        for exclude in excludes:
-            if re.search(r"%s" % exclude, content, re.IGNORECASE):
-                # 发现排除项
-                return False
+        if rule_name not in include_hits:
+            for include_matcher in include_matchers:
+                if not include_matcher(get_content()):
+                    # 未发现包含项
+                    return False
+        if exclude_matcher and exclude_matcher(get_content()):
+            # 发现排除项
+            return False
         if downloadvolumefactor is not None:
             if torrent.downloadvolumefactor != downloadvolumefactor:
                 # FREE规则不匹配
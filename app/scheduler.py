@@ -1,8 +1,9 @@
+import json
 import logging
 import threading
 import traceback
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Tuple
 
 import pytz
 from apscheduler.executors.pool import ThreadPoolExecutor
@@ -11,12 +12,6 @@ from apscheduler.schedulers.background import BackgroundScheduler
 
 from app import schemas
 from app.chain import ChainBase
-from app.chain.mediaserver import MediaServerChain
-from app.chain.site import SiteChain
-from app.chain.subscribe import SubscribeChain
-from app.chain.tmdb import TmdbChain
-from app.chain.torrents import TorrentsChain
-from app.chain.transfer import TransferChain
 from app.core.config import settings
 from app.core.plugin import PluginManager
 from app.log import logger
@@ -39,51 +34,100 @@ class Scheduler(metaclass=Singleton):
     定时任务管理
     """
     # 定时服务
-    _scheduler = BackgroundScheduler(timezone=settings.TZ,
-                                     executors={
-                                         'default': ThreadPoolExecutor(100)
-                                     })
+    _scheduler: BackgroundScheduler = None
     # 退出事件
     _event = threading.Event()
-    # 锁
-    _lock = threading.Lock()
+    # 锁（可重入，保护_jobs的变更）
+    _lock = threading.RLock()
 
     def __init__(self):
 
+        # 各处理链延迟到任务首次运行时再导入，加快启动并减少常驻内存
+
+        def sync_cookies(*args, **kwargs):
+            """
+            同步CookieCloud站点
+            """
+            from app.chain.site import SiteChain
+            return SiteChain().sync_cookies(*args, **kwargs)
+
+        def mediaserver_sync(*args, **kwargs):
+            """
+            同步媒体服务器
+            """
+            from app.chain.mediaserver import MediaServerChain
+            return MediaServerChain().sync(*args, **kwargs)
+
+        def subscribe_check(*args, **kwargs):
+            """
+            订阅元数据更新
+            """
+            from app.chain.subscribe import SubscribeChain
+            return SubscribeChain().check(*args, **kwargs)
+
+        def subscribe_search(*args, **kwargs):
+            """
+            订阅搜索
+            """
+            from app.chain.subscribe import SubscribeChain
+            return SubscribeChain().search(*args, **kwargs)
+
+        def subscribe_refresh(*args, **kwargs):
+            """
+            订阅刷新
+            """
+            from app.chain.subscribe import SubscribeChain
+            return SubscribeChain().refresh(*args, **kwargs)
+
+        def transfer(*args, **kwargs):
+            """
+            下载文件整理
+            """
+            from app.chain.transfer import TransferChain
+            return TransferChain().process(*args, **kwargs)
+
+        def get_random_wallpager():
+            """
+            刷新TMDB壁纸
+            """
+            from app.chain.tmdb import TmdbChain
+            return TmdbChain().get_random_wallpager()
+
         def clear_cache():
             """
             清理缓存
             """
+            from app.chain.torrents import TorrentsChain
             TorrentsChain().clear_cache()
             SchedulerChain().clear_cache()
 
         # 各服务的运行状态
         self._jobs = {
             "cookiecloud": {
-                "func": SiteChain().sync_cookies,
+                "func": sync_cookies,
                 "running": False,
             },
             "mediaserver_sync": {
-                "func": MediaServerChain().sync,
+                "func": mediaserver_sync,
                 "running": False,
             },
             "subscribe_tmdb": {
-                "func": SubscribeChain().check,
+                "func": subscribe_check,
                 "running": False,
             },
             "subscribe_search": {
-                "func": SubscribeChain().search,
+                "func": subscribe_search,
                 "running": False,
                 "kwargs": {
                     "state": "R"
                 }
             },
             "subscribe_refresh": {
-                "func": SubscribeChain().refresh,
+                "func": subscribe_refresh,
                 "running": False,
             },
             "transfer": {
-                "func": TransferChain().process,
+                "func": transfer,
                 "running": False,
             },
             "clear_cache": {
@@ -92,6 +136,17 @@ class Scheduler(metaclass=Singleton):
             }
         }
 
+        # 时区对象与当前时间只获取一次
+        tz = pytz.timezone(settings.TZ)
+        now_tz = datetime.now(tz)
+
+        # 按任务规模设置线程池大小，避免常驻100个空闲线程的内存与切换开销
+        self._scheduler = BackgroundScheduler(
+            timezone=tz,
+            executors={
+                'default': ThreadPoolExecutor(min(32, len(self._jobs) * 2))
+            })
+
         # 调试模式不启动定时服务
         if settings.DEV:
             return
@@ -105,7 +160,7 @@ class Scheduler(metaclass=Singleton):
                 id="cookiecloud",
                 name="同步CookieCloud站点",
                 minutes=int(settings.COOKIECLOUD_INTERVAL),
-                next_run_time=datetime.now(pytz.timezone(settings.TZ)) + timedelta(minutes=1),
+                next_run_time=now_tz + timedelta(minutes=1),
                 kwargs={
                     'job_id': 'cookiecloud'
                 }
@@ -120,7 +175,7 @@ class Scheduler(metaclass=Singleton):
                 id="mediaserver_sync",
                 name="同步媒体服务器",
                 hours=int(settings.MEDIASERVER_SYNC_INTERVAL),
-                next_run_time=datetime.now(pytz.timezone(settings.TZ)) + timedelta(minutes=5),
+                next_run_time=now_tz + timedelta(minutes=5),
                 kwargs={
                     'job_id': 'mediaserver_sync'
                 }
@@ -164,16 +219,16 @@ class Scheduler(metaclass=Singleton):
             )
 
         if settings.SUBSCRIBE_MODE == "spider":
-            # 站点首页种子定时刷新模式
-            triggers = TimerUtils.random_scheduler(num_executions=30)
-            for trigger in triggers:
+            # 站点首页种子定时刷新模式（触发器持久化，重启后保持原随机分布）
+            triggers = self.__get_spider_triggers(num_executions=30)
+            for hour, minute in triggers:
                 self._scheduler.add_job(
                     self.start,
                     "cron",
-                    id=f"subscribe_refresh|{trigger.hour}:{trigger.minute}",
+                    id=f"subscribe_refresh|{hour}:{minute}",
                     name="订阅刷新",
-                    hour=trigger.hour,
-                    minute=trigger.minute,
+                    hour=hour,
+                    minute=minute,
                     kwargs={
                         'job_id': 'subscribe_refresh'
                     })
@@ -210,10 +265,10 @@ class Scheduler(metaclass=Singleton):
 
         # 后台刷新TMDB壁纸
         self._scheduler.add_job(
-            TmdbChain().get_random_wallpager,
+            get_random_wallpager,
             "interval",
             minutes=30,
-            next_run_time=datetime.now(pytz.timezone(settings.TZ)) + timedelta(seconds=3)
+            next_run_time=now_tz + timedelta(seconds=3)
         )
 
         # 公共定时服务
@@ -245,6 +300,35 @@ class Scheduler(metaclass=Singleton):
         # 启动定时服务
         self._scheduler.start()
 
+    @staticmethod
+    def __get_spider_triggers(num_executions: int) -> List[Tuple[int, int]]:
+        """
+        获取订阅刷新的随机触发时间，首次生成后持久化到磁盘，
+        重启时复用以加快启动并避免调度分布漂移
+        """
+        trigger_file = settings.TEMP_PATH / "__spider_triggers__"
+        # 读取缓存
+        try:
+            if trigger_file.exists():
+                data = json.loads(trigger_file.read_text(encoding="utf-8"))
+                triggers = data.get("triggers") or []
+                if data.get("num_executions") == num_executions and triggers:
+                    return [(int(hour), int(minute)) for hour, minute in triggers]
+        except Exception as e:
+            logger.debug(f"读取订阅刷新触发器缓存失败：{str(e)}")
+        # 重新生成并保存
+        triggers = [(trigger.hour, trigger.minute)
+                    for trigger in TimerUtils.random_scheduler(num_executions=num_executions)]
+        try:
+            trigger_file.parent.mkdir(parents=True, exist_ok=True)
+            trigger_file.write_text(json.dumps({
+                "num_executions": num_executions,
+                "triggers": triggers
+            }), encoding="utf-8")
+        except Exception as e:
+            logger.debug(f"保存订阅刷新触发器缓存失败：{str(e)}")
+        return triggers
+
     def start(self, job_id: str, *args, **kwargs):
         """
         启动定时服务
@@ -281,14 +365,15 @@ class Scheduler(metaclass=Singleton):
         # 移除该插件的全部服务
         self.remove_plugin_job(pid)
         # 获取插件服务列表
+        plugin_manager = PluginManager()
         with self._lock:
             try:
-                plugin_services = PluginManager().run_plugin_method(pid, "get_service") or []
+                plugin_services = plugin_manager.run_plugin_method(pid, "get_service") or []
             except Exception as e:
                 logger.error(f"运行插件 {pid} 服务失败：{str(e)} - {traceback.format_exc()}")
                 return
             # 获取插件名称
-            plugin_name = PluginManager().get_plugin_attr(pid, "plugin_name")
+            plugin_name = plugin_manager.get_plugin_attr(pid, "plugin_name")
             # 开始注册插件服务
             for service in plugin_services:
                 try:
@@ -323,15 +408,17 @@ class Scheduler(metaclass=Singleton):
         with self._lock:
             # 获取插件名称
             plugin_name = PluginManager().get_plugin_attr(pid, "plugin_name")
-            for job_id, service in self._jobs.copy().items():
+            # 先收集该插件的任务ID，避免为安全遍历复制整个任务表
+            job_ids = [job_id for job_id, service in self._jobs.items()
+                       if service.get("pid") == pid]
+            for job_id in job_ids:
+                service = self._jobs.pop(job_id, None) or {}
                 try:
-                    if service.get("pid") == pid:
-                        self._jobs.pop(job_id, None)
-                        try:
-                            self._scheduler.remove_job(job_id)
-                        except JobLookupError:
-                            pass
-                        logger.info(f"移除插件服务({plugin_name})：{service.get('name')}")
+                    try:
+                        self._scheduler.remove_job(job_id)
+                    except JobLookupError:
+                        pass
+                    logger.info(f"移除插件服务({plugin_name})：{service.get('name')}")
                 except Exception as e:
                     logger.error(f"移除插件服务失败：{str(e)} - {job_id}: {service}")
 
@@ -339,49 +426,50 @@ class Scheduler(metaclass=Singleton):
         """
         当前所有任务
         """
+        # 短暂持锁取快照，结果在锁外构建，避免与任务启动/插件更新互相阻塞
         with self._lock:
-            # 返回计时任务
-            schedulers = []
-            # 去重
-            added = []
-            jobs = self._scheduler.get_jobs()
-            # 按照下次运行时间排序
-            jobs.sort(key=lambda x: x.next_run_time)
-            # 将正在运行的任务提取出来 (保障一次性任务正常显示)
-            for job_id, service in self._jobs.items():
-                name = service.get("name")
-                plugin_name = service.get("plugin_name")
-                if service.get("running") and name and plugin_name:
-                    if name not in added:
-                        added.append(name)
-                    schedulers.append(schemas.ScheduleInfo(
-                        id=job_id,
-                        name=name,
-                        provider=plugin_name,
-                        status="正在运行",
-                    ))
-            # 获取其他待执行任务
-            for job in jobs:
-                if job.name not in added:
-                    added.append(job.name)
-                else:
-                    continue
-                job_id = job.id.split("|")[0]
-                service = self._jobs.get(job_id)
-                if not service:
-                    continue
-                # 任务状态
-                status = "正在运行" if service.get("running") else "等待"
-                # 下次运行时间
-                next_run = TimerUtils.time_difference(job.next_run_time)
+            jobs_snapshot = {job_id: dict(service) for job_id, service in self._jobs.items()}
+        # 返回计时任务
+        schedulers = []
+        # 去重
+        added = set()
+        jobs = self._scheduler.get_jobs()
+        # 按照下次运行时间排序
+        jobs.sort(key=lambda x: x.next_run_time)
+        # 将正在运行的任务提取出来 (保障一次性任务正常显示)
+        for job_id, service in jobs_snapshot.items():
+            name = service.get("name")
+            plugin_name = service.get("plugin_name")
+            if service.get("running") and name and plugin_name:
+                added.add(name)
                 schedulers.append(schemas.ScheduleInfo(
                     id=job_id,
-                    name=job.name,
-                    provider=service.get("plugin_name", "[系统]"),
-                    status=status,
-                    next_run=next_run
+                    name=name,
+                    provider=plugin_name,
+                    status="正在运行",
                 ))
-            return schedulers
+        # 获取其他待执行任务
+        for job in jobs:
+            if job.name not in added:
+                added.add(job.name)
+            else:
+                continue
+            job_id = job.id.split("|")[0]
+            service = jobs_snapshot.get(job_id)
+            if not service:
+                continue
+            # 任务状态
+            status = "正在运行" if service.get("running") else "等待"
+            # 下次运行时间
+            next_run = TimerUtils.time_difference(job.next_run_time)
+            schedulers.append(schemas.ScheduleInfo(
+                id=job_id,
+                name=job.name,
+                provider=service.get("plugin_name", "[系统]"),
+                status=status,
+                next_run=next_run
+            ))
+        return schedulers
 
     def stop(self):
         """
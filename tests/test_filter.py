@@ -22,3 +22,52 @@ class FilterTest(TestCase):
                                          torrent_list=[torrent])
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0].pri_order, 97)
+
+    def test_filter_parenthesized(self):
+        torrent = TorrentInfo(title="The Wolf Children Ame and Yuki 2012 BluRay 1080p DTS-HDMA5.1 x265.10bit-CHD",
+                              description="狼的孩子雨和雪/狼之子雨与雪/Okami kodomo no ame to yuki")
+        _filter = FilterModule()
+        _filter.init_module()
+        # 括号与取反组合：非蓝光原盘且非4K，应命中
+        result = _filter.filter_torrents(rule_string="!(BLU) & !(4K)",
+                                         torrent_list=[torrent])
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].pri_order, 100)
+        # 蓝光原盘包含项未命中，应被过滤
+        result = _filter.filter_torrents(rule_string="BLU & !(4K)",
+                                         torrent_list=[torrent])
+        self.assertEqual(len(result), 0)
+        # 取反项命中1080P，应被过滤
+        result = _filter.filter_torrents(rule_string="!(1080P)",
+                                         torrent_list=[torrent])
+        self.assertEqual(len(result), 0)
+
+    def test_filter_exclude(self):
+        _filter = FilterModule()
+        _filter.init_module()
+        # BLU包含项命中但排除项x265也命中，应被过滤
+        torrent = TorrentInfo(title="Test Movie 2020 Blu-Ray 1080p AVC x265-GRP",
+                              description="")
+        result = _filter.filter_torrents(rule_string="BLU",
+                                         torrent_list=[torrent])
+        self.assertEqual(len(result), 0)
+        # 无排除项命中时应保留
+        torrent = TorrentInfo(title="Test Movie 2020 Blu-Ray 1080p AVC-GRP",
+                              description="")
+        result = _filter.filter_torrents(rule_string="BLU",
+                                         torrent_list=[torrent])
+        self.assertEqual(len(result), 1)
+
+    def test_filter_priority(self):
+        torrent_4k = TorrentInfo(title="Test Movie 2020 2160p WEB-DL H264-GRP",
+                                 description="")
+        torrent_1080p = TorrentInfo(title="Test Movie 2020 1080p WEB-DL H264-GRP",
+                                    description="")
+        _filter = FilterModule()
+        _filter.init_module()
+        # 多级规则按命中级别赋优先级，值越大越优先
+        result = _filter.filter_torrents(rule_string="4K > 1080P",
+                                         torrent_list=[torrent_4k, torrent_1080p])
+        self.assertEqual(len(result), 2)
+        self.assertEqual(torrent_4k.pri_order, 100)
+        self.assertEqual(torrent_1080p.pri_order, 99)